@@ -3,11 +3,83 @@ Reusable conftest template for new pytest projects.
 
 This file demonstrates common fixture patterns. Copy and customize for your project.
 Place in your tests/ directory as conftest.py
+
+Parallel runs (pytest-xdist):
+    Session-scoped fixtures are created once per worker process. Group tests
+    by file so each worker reuses its fixtures instead of rebuilding them for
+    scattered tests:
+
+        [tool.pytest.ini_options]
+        addopts = "-n auto --dist loadfile"
+
+    The default database URL below is suffixed with the xdist worker id, so
+    each worker gets its own in-memory SQLite database.
+
+Autouse fixtures:
+    Every autouse fixture is set up and torn down for every test, which adds
+    up in large or heavily parametrized suites. The only autouse fixture here
+    is _reset_overrides, which touches the app only for tests that request
+    it; reset_environment is opt-in. Put one-time configuration in hooks
+    instead. Warning filters live in pytest_configure below; they can equally
+    go in pyproject.toml at zero per-test cost:
+
+        [tool.pytest.ini_options]
+        filterwarnings = ["ignore::DeprecationWarning"]
+
+Slow tests:
+    Tests that use the database or external API fixtures are marked "slow"
+    automatically (see pytest_collection_modifyitems). Skip them while
+    iterating locally and run everything in CI (or a make test-full target)
+    with pytest -m "":
+
+        [tool.pytest.ini_options]
+        markers = ["slow: long-running integration tests"]
+        addopts = "-m 'not slow'"
 """
 
+import os
 import pytest
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
 from typing import Generator
 
+try:
+    from app import create_app  # Point this at your application factory
+except ImportError as e:
+    # Only tolerate a missing app module or a missing create_app in it (both
+    # report e.name == "app"); a broken import inside the app names the
+    # failing dependency instead and must fail loudly rather than skip
+    if e.name != "app":
+        raise
+    create_app = None
+
+
+# ============================================================================
+# HOOKS (Run once per session, not per test)
+# ============================================================================
+
+def pytest_configure(config):
+    """Suppress expected warnings once for the whole run"""
+    # Registered as an ini filter so pytest applies it inside its own
+    # per-test warning capture; a plain warnings.filterwarnings() call here
+    # would be overridden by pytest's default DeprecationWarning filter.
+    config.addinivalue_line("filterwarnings", "ignore::DeprecationWarning")
+    config.addinivalue_line("markers", "slow: long-running integration tests")
+
+
+# Tests using any of these fixtures (directly or through another fixture)
+# are marked slow
+SLOW_FIXTURES = frozenset({"test_database", "mock_external_api"})
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Mark tests that depend on slow integration fixtures, before -m filtering"""
+    for item in items:
+        if not SLOW_FIXTURES.isdisjoint(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.slow)
+
 
 # ============================================================================
 # SESSION-LEVEL FIXTURES (Shared across entire test suite)
@@ -16,30 +88,30 @@ from typing import Generator
 @pytest.fixture(scope="session")
 def test_config():
     """Load test configuration once per session"""
+    # Named in-memory database with a shared cache: every connection in this
+    # worker sees the same tables, while other xdist workers get their own
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
     return {
-        "database_url": "sqlite:///:memory:",
+        "database_url": f"sqlite:///file:testdb_{worker_id}?mode=memory&cache=shared&uri=true",
         "debug": True,
         "timeout": 30,
     }
 
 
-# ============================================================================
-# MODULE-LEVEL FIXTURES (Shared within a test file)
-# ============================================================================
-
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_database(test_config) -> Generator:
-    """Create test database once per module, clean up after"""
+    """Create test database and tables once per session, clean up after"""
     from sqlalchemy import create_engine
 
     engine = create_engine(test_config["database_url"])
-    # Create tables
+    # Create tables once; per-test isolation comes from db_session rollback
     # Base.metadata.create_all(engine)
 
     yield engine
 
     # Cleanup
     # Base.metadata.drop_all(engine)
+    engine.dispose()
 
 
 # ============================================================================
@@ -48,12 +120,25 @@ def test_database(test_config) -> Generator:
 
 @pytest.fixture
 def db_session(test_database) -> Generator:
-    """Provide clean database session with rollback after each test"""
+    """Provide clean database session with rollback after each test
+
+    Joins the session into an external transaction so that even code under
+    test calling session.commit() is undone at teardown. The SAVEPOINT is
+    restarted whenever the session ends a nested transaction.
+    """
+    from sqlalchemy import event
     from sqlalchemy.orm import sessionmaker
 
     connection = test_database.connect()
     transaction = connection.begin()
     session = sessionmaker(bind=connection)()
+    nested = connection.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session, trans):
+        nonlocal nested
+        if not nested.is_active:
+            nested = connection.begin_nested()
 
     yield session
 
@@ -62,83 +147,115 @@ def db_session(test_database) -> Generator:
     connection.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Create application instance for testing"""
-    from app import create_app
+    """Create application instance once per session"""
+    if create_app is None:
+        pytest.skip("app.create_app is not importable")
     return create_app(config="test")
 
 
+@pytest.fixture(scope="session")
+def _session_client(app) -> Generator:
+    """TestClient shared across the session; use the client fixture instead
+
+    Entering the client runs the app's lifespan startup/shutdown exactly
+    once per session (per worker under xdist).
+    """
+    from fastapi.testclient import TestClient
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def client(_session_client) -> Generator:
+    """Provide FastAPI TestClient, reset to a clean cookie jar and headers after each test"""
+    headers = _session_client.headers.copy()
+    yield _session_client
+    _session_client.cookies.clear()
+    _session_client.headers = headers
+
+
 @pytest.fixture
-def client(app):
-    """Provide FastAPI TestClient"""
+def client_fresh() -> Generator:
+    """Provide a TestClient on a new app with its own lifespan for this test
+
+    Uses a separate app instance so its shutdown cannot tear down state the
+    session-scoped client is still using.
+    """
     from fastapi.testclient import TestClient
-    return TestClient(app)
+    if create_app is None:
+        pytest.skip("app.create_app is not importable")
+    with TestClient(create_app(config="test")) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_overrides(request):
+    """Clear dependency overrides after tests that used the shared app"""
+    yield
+    # Only look up the app when the test requested it, so tests that never
+    # touch the app do not build (or import) it
+    if "app" in request.fixturenames:
+        request.getfixturevalue("app").dependency_overrides.clear()
 
 
 # ============================================================================
 # DATA FIXTURES
 # ============================================================================
 
-@pytest.fixture
+# Read-only and shared by every test. Call dict(...) on it to get a plain dict,
+# both to mutate it and to serialize it (e.g. client.post(..., json=dict(data)));
+# a mappingproxy is not JSON serializable.
+_SAMPLE_USER = MappingProxyType({
+    "id": 1,
+    "email": "test@example.com",
+    "name": "Test User",
+    "is_active": True,
+})
+
+_SAMPLE_PRODUCT = MappingProxyType({
+    "id": 1,
+    "name": "Test Product",
+    "price": 99.99,
+    "in_stock": True,
+})
+
+
+@pytest.fixture(scope="session")
 def sample_user_data():
-    """Standard user data for tests"""
-    return {
-        "id": 1,
-        "email": "test@example.com",
-        "name": "Test User",
-        "is_active": True,
-    }
+    """Standard user data for tests (read-only; use dict(...) to mutate or send as JSON)"""
+    return _SAMPLE_USER
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_product_data():
-    """Standard product data for tests"""
-    return {
-        "id": 1,
-        "name": "Test Product",
-        "price": 99.99,
-        "in_stock": True,
-    }
+    """Standard product data for tests (read-only; use dict(...) to mutate or send as JSON)"""
+    return _SAMPLE_PRODUCT
 
 
 # ============================================================================
 # FACTORY FIXTURES (Generate multiple test objects)
 # ============================================================================
 
+# Defaults are built once; each call merges overrides into a new dict
+_USER_DEFAULTS = {"email": "user@example.com", "name": "Test User", "is_active": True}
+_PRODUCT_DEFAULTS = {"name": "Product", "price": 99.99, "in_stock": True}
+
+
 @pytest.fixture
 def user_factory():
     """Factory for creating user objects with customizable data"""
-    def _make_user(
-        email: str = "user@example.com",
-        name: str = "Test User",
-        is_active: bool = True,
-        **kwargs
-    ) -> dict:
-        return {
-            "email": email,
-            "name": name,
-            "is_active": is_active,
-            **kwargs,
-        }
+    def _make_user(**kwargs) -> dict:
+        return {**_USER_DEFAULTS, **kwargs}
     return _make_user
 
 
 @pytest.fixture
 def product_factory():
     """Factory for creating product objects"""
-    def _make_product(
-        name: str = "Product",
-        price: float = 99.99,
-        in_stock: bool = True,
-        **kwargs
-    ) -> dict:
-        return {
-            "name": name,
-            "price": price,
-            "in_stock": in_stock,
-            **kwargs,
-        }
+    def _make_product(**kwargs) -> dict:
+        return {**_PRODUCT_DEFAULTS, **kwargs}
     return _make_product
 
 
@@ -147,47 +264,47 @@ def product_factory():
 # ============================================================================
 
 @pytest.fixture
-def mock_external_api():
+def mock_external_api(monkeypatch):
     """Mock external API calls"""
-    from unittest.mock import patch, MagicMock
+    import app
+    from unittest.mock import MagicMock
 
-    with patch("app.external_api") as mock:
-        mock.get_data.return_value = {"status": "success"}
-        yield mock
+    # A fresh mock per test so no attribute or child set by one test leaks
+    # into the next; monkeypatch.setattr avoids patch()'s per-test machinery
+    mock = MagicMock()
+    mock.get_data.return_value = {"status": "success"}
+    monkeypatch.setattr(app, "external_api", mock)
+    return mock
 
 
 @pytest.fixture
-def mock_email_service():
+def mock_email_service(monkeypatch):
     """Mock email service"""
-    from unittest.mock import patch
+    import app
+    from unittest.mock import MagicMock
 
-    with patch("app.send_email") as mock:
-        mock.return_value = True
-        yield mock
+    mock = MagicMock(return_value=True)
+    monkeypatch.setattr(app, "send_email", mock)
+    return mock
 
 
 # ============================================================================
-# AUTOUSE FIXTURES (Run automatically for all tests)
+# OPT-IN CLEANUP FIXTURES
 # ============================================================================
 
-@pytest.fixture(autouse=True)
+# Not autouse: pytest dispatches autouse fixtures for every test even when
+# they do nothing. Request it from tests that touch global state, e.g.
+# @pytest.mark.usefixtures("reset_environment"), and switch to autouse=True
+# only once it performs real cleanup that every test needs.
+@pytest.fixture
 def reset_environment():
-    """Reset test environment before each test"""
+    """Reset test environment around tests that change global state"""
     # Clear caches
     # Reset global state
     yield
     # Cleanup after test
 
 
-@pytest.fixture(autouse=True)
-def suppress_warnings():
-    """Suppress expected warnings during tests"""
-    import warnings
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=DeprecationWarning)
-        yield
-
-
 # ============================================================================
 # PARAMETRIZED FIXTURE
 # ============================================================================
@@ -202,15 +319,54 @@ def environment(request):
 # REQUEST CONTEXT FIXTURE
 # ============================================================================
 
+class _LazyMeta(Mapping):
+    """Test metadata computed on first access
+
+    Supports meta.x as well as the read-only dict API (meta["x"], "x" in meta,
+    get, keys, items, == dict).
+    """
+
+    _FIELDS = ("test_name", "test_file", "test_class", "test_markers")
+
+    def __init__(self, request):
+        self._node = request.node
+        self._cls = request.cls
+
+    @cached_property
+    def test_name(self):
+        return self._node.name
+
+    @cached_property
+    def test_file(self):
+        return str(self._node.fspath)
+
+    @cached_property
+    def test_class(self):
+        return self._cls.__name__ if self._cls else None
+
+    @cached_property
+    def test_markers(self):
+        return [marker.name for marker in self._node.iter_markers()]
+
+    def __getitem__(self, key):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self._FIELDS
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self):
+        return len(self._FIELDS)
+
+
 @pytest.fixture
 def test_metadata(request):
-    """Provide metadata about current test"""
-    return {
-        "test_name": request.node.name,
-        "test_file": str(request.node.fspath),
-        "test_class": request.cls.__name__ if request.cls else None,
-        "test_markers": [marker.name for marker in request.node.iter_markers()],
-    }
+    """Provide metadata about current test, computed lazily"""
+    return _LazyMeta(request)
 
 
 # ============================================================================
@@ -218,22 +374,16 @@ def test_metadata(request):
 # ============================================================================
 
 @pytest.fixture
-def client_with_auth(app, sample_user_data):
+def client_with_auth(app, client, sample_user_data):
     """FastAPI client with mocked authentication"""
-    from fastapi.testclient import TestClient
-    from unittest.mock import patch
-
     def override_get_current_user():
-        return sample_user_data
+        return dict(sample_user_data)
 
     # Assuming your app has a get_current_user dependency
     # app.dependency_overrides[get_current_user] = override_get_current_user
 
-    client = TestClient(app)
-    yield client
-
-    # Cleanup
-    # app.dependency_overrides.clear()
+    # Overrides are cleared by _reset_overrides after the test
+    return client
 
 
 # ============================================================================
@@ -5,162 +5,247 @@ Fixture generator utility for creating common pytest fixture patterns.
 Usage:
     python fixture_generator.py --fixture-type factory --name user
     python fixture_generator.py --fixture-type database --name postgres
+    echo '[{"fixture_type": "factory", "name": "user"}]' | python fixture_generator.py --batch
 """
 
-import argparse
+import io
+import json
+import string
 import sys
 from typing import Dict, Any
 
 
 FIXTURE_TEMPLATES = {
     "factory": """@pytest.fixture
-def {name}_factory():
-    \"\"\"Factory for creating {name} objects with customizable data\"\"\"
-    def _make_{name}(**kwargs) -> dict:
-        return {{
+def ${name}_factory():
+    \"\"\"Factory for creating ${name} objects with customizable data\"\"\"
+    def _make_${name}(**kwargs) -> dict:
+        return {
             # Add fields here
             **kwargs,
-        }}
-    return _make_{name}
+        }
+    return _make_${name}
 """,
 
     "database": """@pytest.fixture
-def {name}_connection(test_config):
-    \"\"\"Create {name} connection for testing\"\"\"
+def ${name}_connection(test_config):
+    \"\"\"Create ${name} connection for testing\"\"\"
     # Initialize connection
-    connection = connect_to_{name}(test_config)
+    connection = connect_to_${name}(test_config)
     yield connection
     # Cleanup
     connection.close()
 """,
 
     "mock": """@pytest.fixture
-def mock_{name}():
-    \"\"\"Mock {name} service\"\"\"
+def mock_${name}():
+    \"\"\"Mock ${name} service\"\"\"
     from unittest.mock import patch, MagicMock
 
-    with patch("app.{name}") as mock:
-        mock.some_method.return_value = {{"status": "mocked"}}
+    with patch("app.${name}") as mock:
+        mock.some_method.return_value = {"status": "mocked"}
         yield mock
 """,
 
     "data": """@pytest.fixture
-def {name}_data():
-    \"\"\"Sample {name} data for tests\"\"\"
-    return {{
+def ${name}_data():
+    \"\"\"Sample ${name} data for tests\"\"\"
+    return {
         "id": 1,
-        "name": "{name}_test",
-    }}
+        "name": "${name}_test",
+    }
 """,
 
     "async": """@pytest.fixture
-async def {name}_async():
-    \"\"\"Async fixture for {name}\"\"\"
+async def ${name}_async():
+    \"\"\"Async fixture for ${name}\"\"\"
     # Setup
-    resource = await setup_{name}()
+    resource = await setup_${name}()
     yield resource
     # Cleanup
-    await cleanup_{name}(resource)
+    await cleanup_${name}(resource)
 """,
 
     "autouse": """@pytest.fixture(autouse=True)
-def {name}_autouse():
-    \"\"\"Auto-run fixture for {name} setup/teardown\"\"\"
+def ${name}_autouse():
+    \"\"\"Auto-run fixture for ${name} setup/teardown\"\"\"
     # Setup runs before each test
     yield
     # Cleanup runs after each test
 """,
 
-    "parametrized": """@pytest.fixture(params={params})
-def {name}_parametrized(request):
-    \"\"\"Parametrized fixture for {name} with multiple values\"\"\"
+    "parametrized": """@pytest.fixture(params=${params})
+def ${name}_parametrized(request):
+    \"\"\"Parametrized fixture for ${name} with multiple values\"\"\"
     return request.param
 """,
 
-    "scoped": """@pytest.fixture(scope="{scope}")
-def {name}_{scope}():
-    \"\"\"Scoped fixture for {name} ({scope} level)\"\"\"
-    yield {{}}
+    "scoped": """@pytest.fixture(scope="${scope}")
+def ${name}_${scope}():
+    \"\"\"Scoped fixture for ${name} (${scope} level)\"\"\"
+    yield {}
 """,
 }
 
+_COMPILED = {
+    fixture_type: string.Template(template)
+    for fixture_type, template in FIXTURE_TEMPLATES.items()
+}
+_FIXTURE_TYPES = tuple(FIXTURE_TEMPLATES)
+_FIXTURE_TYPES_STR = ", ".join(_FIXTURE_TYPES)
+
 
 class FixtureGenerator:
     """Generate pytest fixture code"""
 
     def generate(self, fixture_type: str, name: str, **kwargs) -> str:
         """Generate fixture code for given type and name"""
-        if fixture_type not in FIXTURE_TEMPLATES:
+        if fixture_type not in _COMPILED:
             raise ValueError(
                 f"Unknown fixture type: {fixture_type}. "
-                f"Available: {', '.join(FIXTURE_TEMPLATES.keys())}"
+                f"Available: {_FIXTURE_TYPES_STR}"
             )
 
-        template = FIXTURE_TEMPLATES[fixture_type]
-        return template.format(name=name, **kwargs)
+        return _COMPILED[fixture_type].substitute(name=name, **kwargs)
 
     def generate_conftest(self, fixtures: Dict[str, Dict[str, Any]]) -> str:
         """Generate complete conftest.py from fixture definitions"""
-        lines = [
-            '"""Auto-generated conftest.py with pytest fixtures"""',
-            "",
-            "import pytest",
-            "",
-            "",
-        ]
-
-        for fixture_type, config in fixtures.items():
+        buf = io.StringIO()
+        buf.write('"""Auto-generated conftest.py with pytest fixtures"""\n\nimport pytest\n\n\n')
+
+        for i, (fixture_type, config) in enumerate(fixtures.items()):
+            if i:
+                buf.write("\n")
             name = config.get("name", fixture_type)
-            fixture_code = self.generate(fixture_type, name, **config)
-            lines.append(fixture_code)
-            lines.append("")
+            buf.write(self.generate(fixture_type, name, **config))
+            buf.write("\n")
+
+        return buf.getvalue()
 
-        return "\n".join(lines)
+
+_DEFAULT_SCOPE = "function"
+_DEFAULT_PARAMS = "['value1', 'value2']"
+
+_VALUE_FLAGS = {
+    "--fixture-type": "fixture_type",
+    "--name": "name",
+    "--scope": "scope",
+    "--params": "params",
+}
 
 
-def main():
+def _build_parser():
+    """Build the full argparse parser, used only for --help and bad input"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate pytest fixture code"
     )
     parser.add_argument(
         "--fixture-type",
-        choices=list(FIXTURE_TEMPLATES.keys()),
-        required=True,
-        help="Type of fixture to generate",
+        choices=_FIXTURE_TYPES,
+        help="Type of fixture to generate (required unless --batch)",
     )
     parser.add_argument(
         "--name",
-        required=True,
-        help="Name for the fixture",
+        help="Name for the fixture (required unless --batch)",
     )
     parser.add_argument(
         "--scope",
-        default="function",
+        default=_DEFAULT_SCOPE,
         help="Fixture scope (for scoped fixtures)",
     )
     parser.add_argument(
         "--params",
-        default="['value1', 'value2']",
+        default=_DEFAULT_PARAMS,
         help="Parameters (for parametrized fixtures)",
     )
-
-    args = parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read a JSON list of fixture definitions from stdin",
+    )
+    return parser
+
+
+def _parse_args(argv):
+    """Parse the known flags without argparse; return None if argv needs the full parser"""
+    args = {
+        "fixture_type": None,
+        "name": None,
+        "scope": _DEFAULT_SCOPE,
+        "params": _DEFAULT_PARAMS,
+        "batch": False,
+    }
+    it = iter(argv)
+    for arg in it:
+        if arg == "--batch":
+            args["batch"] = True
+            continue
+        flag, sep, value = arg.partition("=")
+        key = _VALUE_FLAGS.get(flag)
+        if key is None:
+            return None
+        if not sep:
+            value = next(it, None)
+            if value is None:
+                return None
+        args[key] = value
+
+    if not args["batch"] and (
+        args["fixture_type"] not in _COMPILED or args["name"] is None
+    ):
+        return None
+    return args
+
+
+def _fixture_kwargs(fixture_type: str, scope: str, params: str) -> Dict[str, Any]:
+    """Extra template arguments needed by the given fixture type"""
+    if fixture_type == "scoped":
+        return {"scope": scope}
+    if fixture_type == "parametrized":
+        return {"params": params}
+    return {}
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = _parse_args(argv)
+    if args is None:
+        parser = _build_parser()
+        args = vars(parser.parse_args(argv))
+        if not args["batch"] and (args["fixture_type"] is None or args["name"] is None):
+            parser.error("--fixture-type and --name are required unless --batch is given")
 
     generator = FixtureGenerator()
 
-    kwargs = {}
-    if args.fixture_type == "scoped":
-        kwargs["scope"] = args.scope
-    elif args.fixture_type == "parametrized":
-        kwargs["params"] = args.params
-
     try:
-        code = generator.generate(args.fixture_type, args.name, **kwargs)
-        print(code)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
+        if args["batch"]:
+            codes = []
+            for fixture in json.load(sys.stdin):
+                fixture_type = fixture["fixture_type"]
+                kwargs = _fixture_kwargs(
+                    fixture_type,
+                    fixture.get("scope", _DEFAULT_SCOPE),
+                    fixture.get("params", _DEFAULT_PARAMS),
+                )
+                codes.append(generator.generate(fixture_type, fixture["name"], **kwargs))
+            code = "\n".join(codes)
+        else:
+            kwargs = _fixture_kwargs(args["fixture_type"], args["scope"], args["params"])
+            code = generator.generate(args["fixture_type"], args["name"], **kwargs)
+    except KeyError as e:
+        sys.stderr.write(f"Error: batch entry is missing {e}\n")
+        return 1
+    except (ValueError, TypeError) as e:
+        sys.stderr.write(f"Error: {e}\n")
         return 1
 
+    sys.stdout.write(code)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
     return 0
 
 
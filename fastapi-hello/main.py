@@ -1,8 +1,9 @@
 from fastapi import FastAPI
 from pydantic import BaseModel
 from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # For post request body validation
 class TodoItem(BaseModel):
@@ -18,20 +19,33 @@ class TodoItemResponse(BaseModel):
     time_estimate: int = None
     completed: bool = False   
 
+
+# Static todo list, built once at import instead of on every GET /todo
+_TODO_CACHE = [
+    TodoItemResponse(id=1, task="Buy groceries", time_estimate=20),
+    TodoItemResponse(id=2, task="Walk the dog", time_estimate=30),
+    TodoItemResponse(id=3, task="Read a book", time_estimate=25),
+]
+
+# Constant bodies, serialized once; a new Response is built per request so
+# no response object is shared between requests
+_ROOT_BODY = b'{"message":"Hello, World!"}'
+_HEALTH_BODY = b'{"status":"healthy"}'
+
 @app.get("/")
 def read_root():
     """ root end point"""
-    return {"message": "Hello, World!"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 def health_check():
     """ Health Check End Point"""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/hello/{name}")
 def read_hello(name: str):
-    return {"message": f"Hello, {name}!"}
+    return ORJSONResponse(content={"message": f"Hello, {name}!"})
 
 @app.get("/todo")
 # def todo():
@@ -47,13 +61,8 @@ def todo() -> list[TodoItemResponse]:
     #     TodoItem(id=2, task="Walk the dog", time_estimate=30),
     #     TodoItem(id=3, task="Read a book", time_estimate=25),
     # ]    
-    my_todo_list = [
-        TodoItemResponse(id=1, task="Buy groceries", time_estimate=20),
-        TodoItemResponse(id=2, task="Walk the dog", time_estimate=30),
-        TodoItemResponse(id=3, task="Read a book", time_estimate=25),
-    ]     
     # return {"todos": todo_list}
-    return my_todo_list
+    return _TODO_CACHE
 
 @app.post("/todo")
 # def add_todo(item: dict):
@@ -64,7 +73,9 @@ def add_todo(item: TodoItem) -> TodoItemResponse:
             detail="ID cannot be zero"
         )
     
-    todo_response = TodoItemResponse(**item.dict(), completed=False) 
+    todo_response = TodoItemResponse.model_construct(
+        id=item.id, task=item.task, time_estimate=item.time_estimate, completed=False
+    ) 
     # return {"message": "Todo item added", "item": item} 
     # return item
     return todo_response
@@ -72,16 +83,18 @@ def add_todo(item: TodoItem) -> TodoItemResponse:
 
 @app.delete("/todo/{item_id}")
 def delete_todo(item_id: int):
-    return {"message": f"Todo item with id {item_id} deleted"}  
+    return ORJSONResponse(content={"message": f"Todo item with id {item_id} deleted"})  
 
 @app.put("/todo/{item_id}")
 def update_todo(item_id: int, item: TodoItem) -> TodoItemResponse:
-    todo_response = TodoItemResponse(**item.dict(), completed=False)   
+    todo_response = TodoItemResponse.model_construct(
+        id=item.id, task=item.task, time_estimate=item.time_estimate, completed=False
+    )   
     return todo_response
 
 @app.patch("/todo/{item_id}/complete")
 def todo_complete(item_id: int) -> TodoItemResponse:
-    todo_response = TodoItemResponse(id=item_id, task="temp task", completed=True)   
+    todo_response = TodoItemResponse.model_construct(id=item_id, task="temp task", completed=True)   
     return todo_response
 
 